@@ -8,13 +8,17 @@ import { parseArgs } from '../gemini/cli.js';
 // Mock @google/genai — vi.hoisted ensures availability before vi.mock hoist
 // ---------------------------------------------------------------------------
 
-const { mockGenerateContent } = vi.hoisted(() => ({
+const { mockGenerateContent, mockConstructor } = vi.hoisted(() => ({
   mockGenerateContent: vi.fn(),
+  mockConstructor: vi.fn(),
 }));
 
 vi.mock('@google/genai', () => ({
   GoogleGenAI: class {
     models = { generateContent: mockGenerateContent };
+    constructor(options: unknown) {
+      mockConstructor(options);
+    }
   },
 }));
 
@@ -289,6 +293,33 @@ describe('generateText', () => {
     expect(result.error).toBe('safety_filter');
   });
 
+  it('should reuse the client across calls with the same key', async () => {
+    process.env['GEMINI_API_KEY'] = 'reuse-key';
+    mockGenerateContent.mockResolvedValue({
+      candidates: [{ content: { parts: [{ text: 'ok' }] } }],
+    });
+
+    await generateText({ prompt: 'First' });
+    await generateText({ prompt: 'Second' });
+
+    expect(mockConstructor).toHaveBeenCalledTimes(1);
+    expect(mockConstructor).toHaveBeenCalledWith({ apiKey: 'reuse-key' });
+  });
+
+  it('should create a new client when the key changes', async () => {
+    mockGenerateContent.mockResolvedValue({
+      candidates: [{ content: { parts: [{ text: 'ok' }] } }],
+    });
+
+    process.env['GEMINI_API_KEY'] = 'key-a';
+    await generateText({ prompt: 'Hello' });
+    process.env['GEMINI_API_KEY'] = 'key-b';
+    await generateText({ prompt: 'Hello' });
+
+    expect(mockConstructor).toHaveBeenCalledTimes(2);
+    expect(mockConstructor).toHaveBeenLastCalledWith({ apiKey: 'key-b' });
+  });
+
   it('should send prompt only when no context provided', async () => {
     mockGenerateContent.mockResolvedValue({
       candidates: [{
@@ -128,19 +128,18 @@ export function getPlanProgress(planPath: string): PlanProgress {
 
   const content = readFileSync(planPath, 'utf-8');
   const items: PlanItem[] = [];
+  let completed = 0;
 
   for (const line of content.split('\n')) {
     const match = line.trim().match(CHECKBOX_REGEX);
     if (match) {
-      items.push({
-        done: match[1].toLowerCase() === 'x',
-        text: match[2].trim(),
-      });
+      const done = match[1].toLowerCase() === 'x';
+      if (done) completed++;
+      items.push({ done, text: match[2].trim() });
     }
   }
 
   const total = items.length;
-  const completed = items.filter((item) => item.done).length;
   const percentage = total > 0 ? Math.round((completed / total) * 100) : 0;
 
   return { completed, total, percentage, items };
@@ -5,10 +5,9 @@
  * structured results. No external binary dependency.
  */
 
-import { GoogleGenAI } from '@google/genai';
 import { DEFAULT_TEXT_MODEL } from './types.js';
 import type { GeminiInvokeOptions, GeminiResult } from './types.js';
-import { classifyError } from './shared.js';
+import { classifyError, getClient } from './shared.js';
 
 /** Default timeout for API calls (120 seconds). */
 const DEFAULT_TIMEOUT_MS = 120_000;
@@ -36,7 +35,7 @@ export async function generateText(options: GeminiInvokeOptions): Promise<Gemini
   }
 
   try {
-    const ai = new GoogleGenAI({ apiKey });
+    const ai = await getClient(apiKey);
 
     // Build full prompt: context first (if provided), then the prompt
     const fullPrompt = context ? `${context}\n\n${prompt}` : prompt;
@@ -2,6 +2,8 @@
  * Shared Gemini API utilities used by both text generation and image generation.
  */
 
+import type { GoogleGenAI } from '@google/genai';
+
 /**
  * Base error reasons common to all Gemini API calls.
  */
@@ -21,6 +23,27 @@ export function isApiKeySet(): boolean {
   return !!process.env['GEMINI_API_KEY'];
 }
 
+let cachedClient: { apiKey: string; client: GoogleGenAI } | undefined;
+
+/**
+ * Get a GoogleGenAI client for the given API key.
+ *
+ * The client is reused across calls in the same process, which only helps
+ * library consumers that call generateText/generateImage repeatedly; the
+ * one-shot CLIs make a single call per process. A different key replaces
+ * the cached client.
+ *
+ * The SDK is imported on first use, so importing this module (e.g. for
+ * isApiKeySet) or returning early on a missing key never loads it.
+ */
+export async function getClient(apiKey: string): Promise<GoogleGenAI> {
+  if (cachedClient?.apiKey !== apiKey) {
+    const genai = await import('@google/genai');
+    cachedClient = { apiKey, client: new genai.GoogleGenAI({ apiKey }) };
+  }
+  return cachedClient.client;
+}
+
 /**
  * Classify a caught error into an ApiErrorReason.
  */
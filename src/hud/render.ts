@@ -198,6 +198,7 @@ export function renderCost(
 /**
  * Read only the first line of a file without loading the whole thing.
  * Transcript JSONL files can be very large — we only need line 1.
+ * The newline is located in the raw bytes so only line 1 gets decoded.
  */
 function readFirstLine(filePath: string): string | null {
   let fd: number | undefined;
@@ -205,9 +206,9 @@ function readFirstLine(filePath: string): string | null {
     fd = openSync(filePath, 'r');
     const buf = Buffer.alloc(4096);
     const bytesRead = readSync(fd, buf, 0, 4096, 0);
-    const content = buf.toString('utf-8', 0, bytesRead);
-    const newlineIdx = content.indexOf('\n');
-    return newlineIdx >= 0 ? content.substring(0, newlineIdx) : content;
+    const newlineIdx = buf.indexOf(0x0a);
+    const end = newlineIdx >= 0 && newlineIdx < bytesRead ? newlineIdx : bytesRead;
+    return buf.toString('utf-8', 0, end);
   } catch {
     return null;
   } finally {
@@ -255,7 +256,7 @@ export function renderSessionClock(
     try {
       const parsed = JSON.parse(firstLine) as Record<string, unknown>;
       if (typeof parsed.timestamp === 'string') {
-        const ts = new Date(parsed.timestamp).getTime();
+        const ts = Date.parse(parsed.timestamp);
         if (!isNaN(ts)) startTime = ts;
       }
     } catch {
@@ -355,6 +356,9 @@ export function renderUsableContext(
 // Main render function
 // ---------------------------------------------------------------------------
 
+const PREFIX = bold('[kw]');
+const SEPARATOR = dim(' | ');
+
 /**
  * Render the statusline from Claude Code's input.
  *
@@ -406,11 +410,11 @@ export function render(input: StatuslineInput): string {
   if (cost) elements.push(cost);
 
   if (elements.length === 0) {
-    return bold('[kw]');
+    return PREFIX;
   }
 
   // Join with separator and add prefix
-  const line = `${bold('[kw]')} ${elements.join(dim(' | '))}`;
+  const line = `${PREFIX} ${elements.join(SEPARATOR)}`;
 
   // Replace spaces with non-breaking spaces for terminal alignment
   return line.replace(/ /g, '\u00A0');
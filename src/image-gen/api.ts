@@ -2,12 +2,11 @@
  * Gemini image generation API wrapper using @google/genai SDK.
  */
 
-import { GoogleGenAI } from '@google/genai';
 import * as fs from 'node:fs';
 import * as path from 'node:path';
 import { DEFAULT_IMAGE_MODEL } from './types.js';
 import type { ImageGenOptions, ImageGenResult } from './types.js';
-import { classifyError } from '../gemini/shared.js';
+import { classifyError, getClient } from '../gemini/shared.js';
 
 /**
  * Infer MIME type from a file extension.
@@ -73,7 +72,7 @@ export async function generateImage(options: ImageGenOptions): Promise<ImageGenR
   }
 
   try {
-    const ai = new GoogleGenAI({ apiKey });
+    const ai = await getClient(apiKey);
 
     // Build content parts: reference images first, then text prompt
     const parts: Array<{ text: string } | { inlineData: { data: string; mimeType: string } }> = [];
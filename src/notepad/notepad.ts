@@ -49,6 +49,19 @@ const NOTEPAD_TEMPLATE = `## Priority Context
  */
 const ENTRY_REGEX = /^- \[(\d{4}-\d{2}-\d{2}T[\d:.]+Z?)\] (.+)$/;
 
+/**
+ * Build the regex that captures a section's body: the text between the given
+ * ## heading and the next ## heading (or EOF).
+ */
+function sectionRegex(heading: string): RegExp {
+  return new RegExp(`## ${heading}\\n([\\s\\S]*?)(?=\\n## \\w|$)`);
+}
+
+/** Section regexes, compiled once at module load rather than on every read. */
+const PRIORITY_SECTION_REGEX = sectionRegex('Priority Context');
+const WORKING_MEMORY_SECTION_REGEX = sectionRegex('Working Memory');
+const MANUAL_SECTION_REGEX = sectionRegex('Manual');
+
 // ---------------------------------------------------------------------------
 // Path helpers
 // ---------------------------------------------------------------------------
@@ -63,13 +76,10 @@ export function getNotepadPath(cwd?: string): string {
 // ---------------------------------------------------------------------------
 
 /**
- * Extract a section's content from the notepad markdown.
- * Returns the text between the given ## heading and the next ## heading (or EOF).
+ * Extract a section's content from the notepad markdown using one of the
+ * precompiled section regexes.
  */
-function extractSection(content: string, heading: string): string {
-  const regex = new RegExp(
-    `## ${heading}\\n([\\s\\S]*?)(?=\\n## \\w|$)`
-  );
+function extractSection(content: string, regex: RegExp): string {
   const match = content.match(regex);
   return match ? match[1].trim() : '';
 }
@@ -107,6 +117,18 @@ function serializeNotepad(data: NotepadData): string {
   ].join('\n');
 }
 
+/**
+ * Serialize and write NotepadData, creating the .kw-plugin directory if needed.
+ *
+ * Mutators read (a missing file parses as empty data), modify, and call this
+ * once — no template write followed by a re-read of the same file.
+ */
+function writeNotepad(data: NotepadData, cwd?: string): void {
+  const path = getNotepadPath(cwd);
+  mkdirSync(dirname(path), { recursive: true });
+  writeFileSync(path, serializeNotepad(data), 'utf-8');
+}
+
 // ---------------------------------------------------------------------------
 // Init / Read
 // ---------------------------------------------------------------------------
@@ -135,9 +157,9 @@ export function readNotepad(cwd?: string): NotepadData {
   }
 
   const content = readFileSync(path, 'utf-8');
-  const priorityContext = extractSection(content, 'Priority Context');
-  const workingMemoryText = extractSection(content, 'Working Memory');
-  const manualSection = extractSection(content, 'Manual');
+  const priorityContext = extractSection(content, PRIORITY_SECTION_REGEX);
+  const workingMemoryText = extractSection(content, WORKING_MEMORY_SECTION_REGEX);
+  const manualSection = extractSection(content, MANUAL_SECTION_REGEX);
 
   return {
     priorityContext,
@@ -163,10 +185,9 @@ export function setPriorityContext(
   text: string,
   cwd?: string
 ): SetPriorityResult {
-  initNotepad(cwd);
   const data = readNotepad(cwd);
   data.priorityContext = text;
-  writeFileSync(getNotepadPath(cwd), serializeNotepad(data), 'utf-8');
+  writeNotepad(data, cwd);
 
   const result: SetPriorityResult = { success: true };
   if (text.length > PRIORITY_CONTEXT_MAX) {
@@ -189,13 +210,12 @@ export function getWorkingMemory(cwd?: string): NotepadEntry[] {
  * Auto-initializes the notepad if it doesn't exist.
  */
 export function addWorkingMemoryEntry(text: string, cwd?: string): void {
-  initNotepad(cwd);
   const data = readNotepad(cwd);
   data.workingMemory.push({
     timestamp: new Date().toISOString(),
     text,
   });
-  writeFileSync(getNotepadPath(cwd), serializeNotepad(data), 'utf-8');
+  writeNotepad(data, cwd);
 }
 
 // ---------------------------------------------------------------------------
@@ -212,12 +232,11 @@ export function getManualSection(cwd?: string): string {
  * Auto-initializes the notepad if it doesn't exist.
  */
 export function addManualEntry(text: string, cwd?: string): void {
-  initNotepad(cwd);
   const data = readNotepad(cwd);
   data.manualSection = data.manualSection
     ? `${data.manualSection}\n${text}`
     : text;
-  writeFileSync(getNotepadPath(cwd), serializeNotepad(data), 'utf-8');
+  writeNotepad(data, cwd);
 }
 
 // ---------------------------------------------------------------------------
@@ -243,10 +262,9 @@ export function pruneOldEntries(
   const cutoff = Date.now() - maxAgeDays * 24 * 60 * 60 * 1000;
   const before = data.workingMemory.length;
 
-  data.workingMemory = data.workingMemory.filter((entry) => {
-    const entryTime = new Date(entry.timestamp).getTime();
-    return entryTime >= cutoff;
-  });
+  data.workingMemory = data.workingMemory.filter(
+    (entry) => Date.parse(entry.timestamp) >= cutoff
+  );
 
   const pruned = before - data.workingMemory.length;
   if (pruned > 0) {
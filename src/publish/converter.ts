@@ -35,6 +35,11 @@ const SUPPORTED_LANGS = [
   'php',
 ];
 
+const H1_REGEX = /<h1[^>]*>([\s\S]*?)<\/h1>/;
+const H2_REGEX = /<h2[^>]*>([\s\S]*?)<\/h2>/;
+const H2_BOUNDARY_REGEX = /(?=<h2[^>]*>)/;
+const TAG_REGEX = /<[^>]+>/g;
+
 let highlighterCache: Promise<Highlighter> | null = null;
 
 function getHighlighter(): Promise<Highlighter> {
@@ -54,16 +59,21 @@ function splitHtml(
   html: string,
   titleOverride?: string,
 ): { title: string; headerHtml: string; sections: Section[] } {
-  const h1Match = html.match(/<h1[^>]*>([\s\S]*?)<\/h1>/);
-  const title = titleOverride ?? (h1Match ? h1Match[1].replace(/<[^>]+>/g, '').trim() : 'Document');
+  const h1Match = html.match(H1_REGEX);
+  const title = titleOverride ?? (h1Match ? h1Match[1].replace(TAG_REGEX, '').trim() : 'Document');
 
-  const parts = html.split(/(?=<h2[^>]*>)/);
+  const parts = html.split(H2_BOUNDARY_REGEX);
   const headerHtml = parts[0] ?? '';
 
   const sections = parts.slice(1).map((part) => {
-    const h2Match = part.match(/<h2[^>]*>([\s\S]*?)<\/h2>/);
-    const sectionTitle = h2Match ? h2Match[1].replace(/<[^>]+>/g, '').trim() : 'Section';
-    const content = h2Match ? part.replace(/<h2[^>]*>[\s\S]*?<\/h2>/, '') : part;
+    const h2Match = part.match(H2_REGEX);
+    if (!h2Match) return { title: 'Section', content: part };
+
+    // Cut the heading out at the match position instead of re-scanning the
+    // section with a second regex.
+    const start = h2Match.index ?? 0;
+    const sectionTitle = h2Match[1].replace(TAG_REGEX, '').trim();
+    const content = part.slice(0, start) + part.slice(start + h2Match[0].length);
     return { title: sectionTitle, content };
   });
 
@@ -171,10 +171,13 @@ export function readAppendLog<T>(
   try {
     if (!existsSync(path)) return [];
     const raw = readFileSync(path, 'utf-8');
-    return raw
-      .split('\n')
-      .filter((line) => line.trim().length > 0)
-      .map((line) => JSON.parse(line) as T);
+    // One pass over the lines: skip blanks and parse in place, rather than
+    // materializing a filtered copy of the log before mapping it.
+    const entries: T[] = [];
+    for (const line of raw.split('\n')) {
+      if (line.trim().length > 0) entries.push(JSON.parse(line) as T);
+    }
+    return entries;
   } catch {
     return [];
   }